@@ -1,8 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import os
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Cavs Interactive Ticket Sales Dashboard", layout="wide")
@@ -14,17 +16,74 @@ Use the interactive controls to test different sales scenarios and see how they
 # --- LOAD DATA ---
 DATA_DIR = "cavs_hackathon_outputs"
 os.makedirs(DATA_DIR, exist_ok=True)
+# Columns the dashboard uses from each output file, with pinned dtypes so nothing is inferred
+DATA_SCHEMAS = {
+    "model_metrics.csv": {"Metric": "object", "Value": "float64"},
+    "top_features.csv": {"metric": "object", "importance": "float64"},
+    # days_until_game is read as float so a blank cell parses as NaN; it is narrowed to int32 after dropna
+    "historical_pacing_line.csv": {"days_until_game": "float64", "median_cum_share": "float64", "p25": "float64", "p75": "float64"},
+}
+DATA_FILES = tuple(DATA_SCHEMAS)
+
+def data_version():
+    # Source-file mtimes key the data caches so edited outputs are picked up
+    return tuple(
+        os.path.getmtime(path) if os.path.exists(path) else None
+        for path in (os.path.join(DATA_DIR, filename) for filename in DATA_FILES)
+    )
 
-@st.cache_data
-def load_data():
+# Shared read-only frames: no unpickled copy per rerun. A restarted worker reloads from the Parquet side-cache
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_data(version):
     def safe_read(filename):
         path = os.path.join(DATA_DIR, filename)
-        return pd.read_csv(path) if os.path.exists(path) else pd.DataFrame()
-
-    model_metrics = safe_read("model_metrics.csv")
-    top_features = safe_read("top_features.csv")
-    forecast = safe_read("forecast_summary.csv")
-    pacing = safe_read("historical_pacing_line.csv")
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        schema = DATA_SCHEMAS[filename]
+
+        # Reuse the Parquet side-cache only if it was written from this exact CSV; anything else is re-parsed
+        stat = os.stat(path)
+        source = [stat.st_mtime_ns, stat.st_size]
+        parquet_path = os.path.splitext(path)[0] + ".parquet"
+        if os.path.exists(parquet_path):
+            try:
+                df = pd.read_parquet(parquet_path, engine="pyarrow", columns=list(schema))
+            except (OSError, ValueError):
+                df = None
+            if df is not None and df.attrs.get("source") == source:
+                # Parquet may hand back its own string dtype; match what the CSV parse returns
+                return df.astype(schema)
+
+        # pyarrow parses in native, multithreaded code and hands back typed columns
+        df = pd.read_csv(path, engine="pyarrow", usecols=list(schema), dtype=schema)
+        # attrs are stored in the Parquet metadata and identify the CSV the cache came from
+        df.attrs["source"] = source
+        # Written under a temporary name and swapped in, so readers never see a partial file
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, suffix=".parquet")
+            os.close(fd)
+            df.to_parquet(tmp_path, engine="pyarrow", compression="snappy")
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            pass  # read-only deployments simply keep parsing the CSV
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return df
+
+    # The files are independent and pyarrow releases the GIL, so a cold load reads them side by side;
+    # results come back in DATA_FILES order
+    with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as pool:
+        model_metrics, top_features, pacing = pool.map(safe_read, DATA_FILES)
+
+    # Sorted once here so the importance chart can plot the rows as they are
+    if not top_features.empty:
+        top_features = top_features.sort_values("importance", ascending=True).reset_index(drop=True)
+
+    # Rows without a day can't be placed on the pacing line
+    if not pacing.empty:
+        pacing = pacing.dropna(subset=["days_until_game"])
 
     # Default pacing fallback if missing
     if pacing.empty:
@@ -33,73 +92,157 @@ def load_data():
             "median_cum_share": [0.10, 0.25, 0.50, 0.75, 0.92, 1.00],
             "p25": [0.05, 0.15, 0.35, 0.60, 0.80, 0.95],
             "p75": [0.15, 0.35, 0.60, 0.85, 0.97, 1.00]
-        })
-    return model_metrics, top_features, forecast, pacing
-
-model_metrics, top_features, forecast, pacing = load_data()
+        }).astype(DATA_SCHEMAS["historical_pacing_line.csv"])
+    pacing = pacing.astype({"days_until_game": "int32"})
+    return model_metrics, top_features, pacing
+
+version = data_version()
+model_metrics, top_features, pacing = load_data(version)
+
+MAX_SALES_WINDOW = 150
+
+# Nearest historical P25/P75 for every whole sales-window day, so a rerun is a plain index
+@st.cache_resource(max_entries=1)
+def pacing_lookup(version, _pacing, max_window):
+    pacing = _pacing
+    days = pacing["days_until_game"].to_numpy()
+    windows = np.arange(max_window + 1)
+    # Binary-search each window between its two neighbouring days instead of a full days x windows diff
+    order = np.argsort(days, kind="stable")
+    sorted_days = days[order]
+    right = np.searchsorted(sorted_days, windows).clip(0, len(days) - 1)
+    left = (right - 1).clip(0)
+    # Snap to the first row of any run of equal days so ties still go to the earliest CSV row
+    left = np.searchsorted(sorted_days, sorted_days[left])
+    right = np.searchsorted(sorted_days, sorted_days[right])
+    left_gap = np.abs(windows - sorted_days[left])
+    right_gap = np.abs(sorted_days[right] - windows)
+    take_right = (right_gap < left_gap) | ((right_gap == left_gap) & (order[right] < order[left]))
+    nearest = order[np.where(take_right, right, left)]
+    p25_by_window = pacing["p25"].to_numpy()[nearest]
+    p75_by_window = pacing["p75"].to_numpy()[nearest]
+    p25_by_window.flags.writeable = False
+    p75_by_window.flags.writeable = False
+    return p25_by_window, p75_by_window
+
+# --- SCENARIO OPTIONS & WEIGHTS ---
+BASE_SALES = 1000
+GOAL_TICKETS = 2500
+GAUGE_MAX = 3500
+# Static gauge styling; only the forecast value changes between scenarios
+GAUGE_TITLE = "Projected Ticket Sales vs Goal"
+GAUGE_BAR_COLOR = "blue"
+# (lo, hi, colour) background bands
+GAUGE_BANDS = (
+    (0, GOAL_TICKETS * 0.8, "lightcoral"),
+    (GOAL_TICKETS * 0.8, GOAL_TICKETS, "gold"),
+    (GOAL_TICKETS, GAUGE_MAX, "lightgreen"),
+)
+GAUGE_UP_COLOR = "green"
+GAUGE_DOWN_COLOR = "red"
+# Shared chart config: no Plotly logo in the modebar
+PLOTLY_CONFIG = {"displaylogo": False}
+# The read-only summary chart drops the modebar
+SUMMARY_PLOTLY_CONFIG = {**PLOTLY_CONFIG, "displayModeBar": False}
+# WebGL pacing lines render at 1x device pixels; wheel zoom stays off so page scrolling works
+PACING_PLOTLY_CONFIG = {**PLOTLY_CONFIG, "plotGlPixelRatio": 1, "scrollZoom": False}
+
+# Each option's position is its code into the matching weight array
+TIER_OPTIONS = ("A+", "A", "B", "C", "D")
+TIER_WEIGHTS = np.array([1.30, 1.20, 1.00, 0.85, 0.70])
+GIVEAWAY_OPTIONS = ("None", "T-Shirt", "Bobblehead", "Poster", "Food Voucher")
+GIVEAWAY_WEIGHTS = np.array([1.00, 1.08, 1.12, 1.05, 1.10])
+THEME_OPTIONS = ("Regular Night", "Home Opener", "Pride", "Salute to Service", "Fan Appreciation")
+THEME_WEIGHTS = np.array([1.00, 1.30, 1.15, 1.10, 1.20])
+DOW_OPTIONS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+DOW_WEIGHTS = np.array([1.10, 0.92, 0.90, 0.95, 1.02, 1.05, 1.08])
+# Tier and giveaway momentum terms pre-scaled with the same expressions the rerun used to evaluate
+TIER_MOMENTUM = (TIER_WEIGHTS / 1.3) * 0.1
+GIVEAWAY_MOMENTUM = (GIVEAWAY_WEIGHTS / 1.12) * 0.1
+for weights in (TIER_WEIGHTS, GIVEAWAY_WEIGHTS, THEME_WEIGHTS, DOW_WEIGHTS, TIER_MOMENTUM, GIVEAWAY_MOMENTUM):
+    weights.flags.writeable = False
 
 # --- SIDEBAR CONTROLS ---
 st.sidebar.header("🎛️ Scenario Controls")
-sales_window = st.sidebar.slider("Sales Window (days open for sale)", 1, 150, 90, 1)
-avg_tix_txn = st.sidebar.slider("Average Tickets per Transaction", 1.0, 6.0, 3.0, 0.5)
-txns = st.sidebar.slider("Number of Transactions (txns)", 100, 800, 400, 10)
-tier = st.sidebar.selectbox("Tier (Game Attractiveness)", ["A+", "A", "B", "C", "D"], index=1)
-giveaway = st.sidebar.selectbox("Giveaway Type", ["None", "T-Shirt", "Bobblehead", "Poster", "Food Voucher"], index=1)
-theme = st.sidebar.selectbox("Theme Night", ["Regular Night", "Home Opener", "Pride", "Salute to Service", "Fan Appreciation"], index=0)
-day_of_week = st.sidebar.selectbox("Day of Week", ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"], index=0)
-st.sidebar.info("Adjust sliders and dropdowns to simulate real-time pacing and forecast performance.")
+# Batch control changes in a form so the script reruns once per Apply, not per widget
+with st.sidebar.form("scenario_controls"):
+    sales_window = st.slider("Sales Window (days open for sale)", 1, MAX_SALES_WINDOW, 90, 1)
+    avg_tix_txn = st.slider("Average Tickets per Transaction", 1.0, 6.0, 3.0, 0.5)
+    txns = st.slider("Number of Transactions (txns)", 100, 800, 400, 10)
+    # Selectboxes hand back the option code directly; labels are only used for display
+    tier_code = st.selectbox("Tier (Game Attractiveness)", range(len(TIER_OPTIONS)), index=1, format_func=TIER_OPTIONS.__getitem__)
+    giveaway_code = st.selectbox("Giveaway Type", range(len(GIVEAWAY_OPTIONS)), index=1, format_func=GIVEAWAY_OPTIONS.__getitem__)
+    theme_code = st.selectbox("Theme Night", range(len(THEME_OPTIONS)), index=0, format_func=THEME_OPTIONS.__getitem__)
+    dow_code = st.selectbox("Day of Week", range(len(DOW_OPTIONS)), index=0, format_func=DOW_OPTIONS.__getitem__)
+    st.form_submit_button("Apply Scenario")
+st.sidebar.info("Adjust sliders and dropdowns, then click Apply Scenario to simulate pacing and forecast performance.")
 
 # ===========================
 # WEIGHTS AND SCENARIO CALCULATION
 # ===========================
-tier_weight = {"A+": 1.30, "A": 1.20, "B": 1.00, "C": 0.85, "D": 0.70}
-giveaway_weight = {"None": 1.00, "T-Shirt": 1.08, "Bobblehead": 1.12, "Poster": 1.05, "Food Voucher": 1.10}
-theme_weight = {"Home Opener": 1.30, "Pride": 1.15, "Salute to Service": 1.10, "Fan Appreciation": 1.20, "Regular Night": 1.00}
-dow_weight = {"Sunday": 1.10, "Saturday": 1.08, "Friday": 1.05, "Thursday": 1.02,
-              "Wednesday": 0.95, "Tuesday": 0.90, "Monday": 0.92}
-
-tier_w = tier_weight.get(tier, 1.0)
-give_w = giveaway_weight.get(giveaway, 1.0)
-theme_w = theme_weight.get(theme, 1.0)
-dow_w = dow_weight.get(day_of_week, 1.0)
+# .item() returns plain Python floats, keeping the scalar forecast math off NumPy
+tier_w = TIER_WEIGHTS.item(tier_code)
+give_w = GIVEAWAY_WEIGHTS.item(giveaway_code)
+theme_w = THEME_WEIGHTS.item(theme_code)
+dow_w = DOW_WEIGHTS.item(dow_code)
 
 # --- FORECAST CALCULATION ---
-base_sales = 1000
 forecast_value = (
-    base_sales +
+    BASE_SALES +
     (sales_window * 5.5) +
     (avg_tix_txn * 80) +
     (txns * 1.3)
 ) * tier_w * give_w * theme_w * dow_w
 
-goal = 2500
-gap = goal - forecast_value
-gap_status = "above goal 🎉" if forecast_value >= goal else "below goal ⚠️"
+gap = GOAL_TICKETS - forecast_value
+gap_status = "above goal 🎉" if forecast_value >= GOAL_TICKETS else "below goal ⚠️"
 
 # --- KPI DISPLAY ---
 col1, col2, col3 = st.columns(3)
-col1.metric("🎯 Goal (tickets)", goal)
-col2.metric("📈 Forecast (scenario)", int(forecast_value))
-col3.metric("⚠️ Gap to Goal", int(gap))
+col1.metric("🎯 Goal (tickets)", GOAL_TICKETS)
+# The gauge below reuses these integers so both read the same numbers
+forecast_tickets = int(forecast_value)
+gap_tickets = int(gap)
+col2.metric("📈 Forecast (scenario)", forecast_tickets)
+col3.metric("⚠️ Gap to Goal", gap_tickets)
 st.caption(f"Your current scenario is **{gap_status}** by {abs(gap):,.0f} tickets.")
 
 # --- GAUGE CHART ---
-fig_gauge = go.Figure(go.Indicator(
-    mode="gauge+number+delta",
-    value=forecast_value,
-    delta={"reference": goal, "increasing": {"color": "green"}, "decreasing": {"color": "red"}},
-    gauge={
-        "axis": {"range": [0, 3500]},
-        "bar": {"color": "blue"},
-        "steps": [
-            {"range": [0, goal * 0.8], "color": "lightcoral"},
-            {"range": [goal * 0.8, goal], "color": "gold"},
-            {"range": [goal, 3500], "color": "lightgreen"}
-        ],
-    },
-    title={"text": "Projected Ticket Sales vs Goal"}
-))
-st.plotly_chart(fig_gauge, use_container_width=True)
+# Inline SVG bullet gauge; the static bands are laid out once at import
+GAUGE_LEFT, GAUGE_WIDTH = 20, 560
+
+def gauge_x(tickets):
+    return GAUGE_LEFT + GAUGE_WIDTH * min(max(tickets, 0), GAUGE_MAX) / GAUGE_MAX
+
+GAUGE_SVG = (
+    '<svg viewBox="0 0 600 130" width="100%" fill="currentColor" role="img" aria-label="{label}">'
+    f'<text x="300" y="22" text-anchor="middle" font-size="17">{GAUGE_TITLE}</text>'
+    + "".join(
+        f'<rect x="{gauge_x(lo):.1f}" y="40" width="{gauge_x(hi) - gauge_x(lo):.1f}" height="36" fill="{color}"/>'
+        for lo, hi, color in GAUGE_BANDS
+    )
+    + f'<line x1="{gauge_x(GOAL_TICKETS):.1f}" y1="34" x2="{gauge_x(GOAL_TICKETS):.1f}" y2="82" stroke="currentColor" stroke-width="2"/>'
+    + f'<text x="{GAUGE_LEFT}" y="94" font-size="11">0</text>'
+    + f'<text x="{GAUGE_LEFT + GAUGE_WIDTH}" y="94" font-size="11" text-anchor="end">{GAUGE_MAX:,}</text>'
+    + f'<rect x="{GAUGE_LEFT}" y="52" width="{{bar_width:.1f}}" height="12" fill="{GAUGE_BAR_COLOR}"/>'
+    + '<text x="300" y="122" text-anchor="middle" font-size="26">{value:,} '
+    + '<tspan font-size="16" fill="{delta_color}">{delta_arrow}{delta:,}</tspan></text>'
+    + "</svg>"
+)
+
+def gauge_svg(forecast_value, forecast_tickets, gap_tickets):
+    # Labels use the KPI integers; the bar and arrow follow the unrounded forecast
+    above_goal = forecast_value >= GOAL_TICKETS
+    return GAUGE_SVG.format(
+        label=f"Forecast {forecast_tickets:,} of {GOAL_TICKETS:,} ticket goal",
+        bar_width=gauge_x(forecast_value) - GAUGE_LEFT,
+        value=forecast_tickets,
+        delta_color=GAUGE_UP_COLOR if above_goal else GAUGE_DOWN_COLOR,
+        delta_arrow="▲" if above_goal else "▼",
+        delta=abs(gap_tickets),
+    )
+
+st.markdown(gauge_svg(forecast_value, forecast_tickets, gap_tickets), unsafe_allow_html=True)
 
 st.divider()
 
@@ -108,94 +251,158 @@ momentum = (
     (sales_window / 150) * 0.4 +
     (avg_tix_txn / 6) * 0.2 +
     (txns / 800) * 0.2 +
-    (tier_w / 1.3) * 0.1 +
-    (give_w / 1.12) * 0.1
+    TIER_MOMENTUM.item(tier_code) +
+    GIVEAWAY_MOMENTUM.item(giveaway_code)
 )
 scenario_share = max(0.05, min(momentum, 1.0))
 
 # Find nearest pacing values to this sales window
-nearest_row = pacing.iloc[(pacing["days_until_game"] - sales_window).abs().argmin()]
-p25_val = nearest_row["p25"]
-p75_val = nearest_row["p75"]
+p25_by_window, p75_by_window = pacing_lookup(version, pacing, MAX_SALES_WINDOW)
+p25_val = p25_by_window[sales_window]
+p75_val = p75_by_window[sales_window]
 
 # --- Determine Indicator Color ---
-if scenario_share < p25_val:
-    indicator_color = "red"
-    perf_status = "🔴 Danger Zone (<P25)"
-elif scenario_share < p75_val:
-    indicator_color = "gold"
-    perf_status = "🟡 On Pace (Median Range)"
-else:
-    indicator_color = "green"
-    perf_status = "🟢 Strong (>P75)"
+# Colour, label and timeline callout for each pacing zone, below P25 / up to P75 / above
+PACING_ZONES = (
+    ("red", "🔴 Danger Zone (<P25)", st.error, "⚠️ Urgent: Implement interventions immediately to boost pace!"),
+    ("gold", "🟡 On Pace (Median Range)", st.warning, "🟡 Moderate pace — plan mid-cycle interventions."),
+    ("green", "🟢 Strong (>P75)", st.success, "🟢 Strong pace — maintain current strategy."),
+)
+# Number of percentile bounds the share has reached (P25 <= P75), i.e. the zone index
+zone = bisect_right((p25_val, p75_val), scenario_share)
+indicator_color, perf_status, zone_callout, zone_message = PACING_ZONES[zone]
 
 st.subheader("📊 Historical Pacing Line – Scenario Comparison")
 st.caption(f"Current pacing classification: **{perf_status}**")
 
 # --- HISTORICAL PACING CHART ---
-fig_pace = px.line(
-    pacing,
-    x="days_until_game",
-    y=["median_cum_share", "p25", "p75"],
-    labels={"value": "Cumulative Sales Share", "days_until_game": "Days Until Game"},
-    title="Ticket Sales Pace vs. Scenario Momentum"
-)
-fig_pace.update_traces(mode="lines+markers")
-
-# Add scenario marker
-fig_pace.add_vline(
-    x=sales_window,
-    line_dash="dash",
-    line_color=indicator_color,
-    annotation_text=f"Scenario ({sales_window} days)",
-    annotation_position="top right"
-)
-fig_pace.add_trace(go.Scatter(
-    x=[sales_window],
-    y=[scenario_share],
-    mode="markers+text",
-    name="Your Scenario",
-    text=[f"{scenario_share*100:.0f}%"],
-    textposition="top center",
-    marker=dict(size=12, color=indicator_color, symbol="circle")
-))
-fig_pace.update_layout(
-    xaxis=dict(autorange="reversed"),
-    legend=dict(title="Percentile Lines", orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-)
-st.plotly_chart(fig_pace, use_container_width=True)
+MAX_PACING_POINTS = 500
+
+def lttb_indices(x, y, n_out):
+    # Largest-Triangle-Three-Buckets: keep the n_out points that best preserve the line's shape
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = [0]
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        a = keep[-1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        keep.append(lo + int(area.argmax()))
+    keep.append(n - 1)
+    return np.array(keep)
+
+# The percentile lines only depend on the pacing data, so build them once and copy per rerun
+@st.cache_resource(max_entries=1)
+def build_pacing_base_fig(version, _pacing):
+    # Plotly loads on the first chart build, after the KPIs and SVG gauge have already streamed out
+    import plotly.graph_objects as go
+
+    pacing = _pacing
+    days = pacing["days_until_game"].to_numpy()
+    traces = []
+    for col in ("median_cum_share", "p25", "p75"):
+        values = pacing[col].to_numpy()
+        # Long pacing histories are thinned before they reach the browser
+        keep = lttb_indices(days, values, MAX_PACING_POINTS)
+        traces.append(go.Scattergl(
+            x=days[keep],
+            y=values[keep],
+            mode="lines+markers",
+            name=col,
+            hovertemplate=f"variable={col}<br>Days Until Game=%{{x}}<br>Cumulative Sales Share=%{{y}}<extra></extra>"
+        ))
+    # Empty scenario marker; each rerun only fills in its position, label and colour
+    traces.append(go.Scatter(
+        mode="markers+text",
+        name="Your Scenario",
+        textposition="top center",
+        marker=dict(size=12, symbol="circle")
+    ))
+    fig = go.Figure(traces)
+    fig.update_layout(
+        title="Ticket Sales Pace vs. Scenario Momentum",
+        xaxis=dict(title="Days Until Game", autorange="reversed"),
+        yaxis=dict(title="Cumulative Sales Share"),
+        legend=dict(title="Percentile Lines", orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        # Hover looks up points by x instead of searching every trace for the nearest one
+        hovermode="x", spikedistance=0
+    )
+    return fig
+
+# Repeated scenarios reuse the finished figure; only new ones copy the base and place the marker
+@st.cache_resource(max_entries=256)
+def build_pacing_fig(version, _pacing, sales_window, scenario_share, indicator_color):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(build_pacing_base_fig(version, _pacing))
+
+    # Add scenario marker; the vline is written as the shape/annotation add_vline would emit,
+    # without its subplot and position resolution
+    fig.update_layout(
+        shapes=[dict(
+            type="line", x0=sales_window, x1=sales_window, xref="x", y0=0, y1=1, yref="y domain",
+            line=dict(dash="dash", color=indicator_color)
+        )],
+        annotations=[dict(
+            text=f"Scenario ({sales_window} days)", showarrow=False,
+            x=sales_window, xref="x", xanchor="left", y=1, yref="y domain", yanchor="top"
+        )]
+    )
+    fig.data[-1].update(
+        x=[sales_window],
+        y=[scenario_share],
+        text=[f"{scenario_share*100:.0f}%"],
+        marker_color=indicator_color
+    )
+    return fig
+
+fig_pace = build_pacing_fig(version, pacing, sales_window, scenario_share, indicator_color)
+st.plotly_chart(fig_pace, use_container_width=True, config=PACING_PLOTLY_CONFIG)
 
 st.divider()
 
 # --- ENHANCED INTERVENTION TIMELINE ---
-st.subheader("🕓 Strategic Intervention Timeline")
-
-if "Danger" in perf_status:
-    st.error("⚠️ Urgent: Implement interventions immediately to boost pace!")
-elif "On Pace" in perf_status:
-    st.warning("🟡 Moderate pace — plan mid-cycle interventions.")
-else:
-    st.success("🟢 Strong pace — maintain current strategy.")
-
-interventions = pd.DataFrame({
+# Fixed playbook; plain columns so no DataFrame is built per rerun
+PHASES = ("Awareness", "Momentum", "Urgency", "Last Call")
+INTERVENTIONS = {
     "Days Before Game": [90, 60, 30, 7],
     "Intervention": ["Launch Early Marketing", "Add Giveaway Promotion", "Push Urgency Campaign", "Offer Limited-Time Discount"],
     "Expected Effect (%)": [10, 8, 5, 3],
-    "Phase": ["Awareness", "Momentum", "Urgency", "Last Call"]
-})
+    "Phase": list(PHASES)
+}
 
-phase_colors = {phase: indicator_color for phase in interventions["Phase"]}
+st.subheader("🕓 Strategic Intervention Timeline")
 
-fig_timeline = px.scatter(
-    interventions, x="Days Before Game", y="Expected Effect (%)",
-    text="Intervention", color="Phase",
-    color_discrete_map=phase_colors, size="Expected Effect (%)",
-)
-fig_timeline.update_traces(textposition="top center", marker=dict(line=dict(width=1, color="black")))
-fig_timeline.update_layout(title="📈 Recommended Interventions and Expected Lift",
-                           xaxis_title="Days Before Game", yaxis_title="Expected Pacing Lift (%)",
-                           xaxis=dict(autorange="reversed"), template="plotly_white", height=450)
-st.plotly_chart(fig_timeline, use_container_width=True)
+zone_callout(zone_message)
+
+# The playbook is fixed, so the chart only varies with the zone colour — three entries at most
+@st.cache_resource
+def build_timeline_fig(indicator_color):
+    # plotly.express is only needed for this chart, so it is imported here rather than at startup
+    import plotly.express as px
+
+    phase_colors = dict.fromkeys(PHASES, indicator_color)
+    fig = px.scatter(
+        INTERVENTIONS, x="Days Before Game", y="Expected Effect (%)",
+        text="Intervention", color="Phase",
+        color_discrete_map=phase_colors, size="Expected Effect (%)",
+        render_mode="webgl",
+    )
+    fig.update_traces(textposition="top center", marker=dict(line=dict(width=1, color="black")))
+    fig.update_layout(title="📈 Recommended Interventions and Expected Lift",
+                      xaxis_title="Days Before Game", yaxis_title="Expected Pacing Lift (%)",
+                      xaxis=dict(autorange="reversed"), template="plotly_white", height=450,
+                      hovermode="x", spikedistance=0)
+    return fig
+
+fig_timeline = build_timeline_fig(indicator_color)
+st.plotly_chart(fig_timeline, use_container_width=True, config=PLOTLY_CONFIG)
 
 st.caption("Each circle represents an intervention opportunity — earlier actions yield higher potential lift.")
 
@@ -204,17 +411,29 @@ st.subheader("📊 Model Insights Explorer")
 
 slides = []
 
-# --- SLIDE 1: Feature Importance ---
-if not top_features.empty:
-    fig_imp = px.bar(
-        top_features.sort_values("importance", ascending=True),
-        x="importance",
-        y="metric",
+# Feature importances never change between reruns, so the bar chart is built once
+@st.cache_resource(max_entries=1)
+def build_importance_fig(version, _top_features):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(
+        x=_top_features["importance"],
+        y=_top_features["metric"],
         orientation="h",
-        color="importance",
-        color_continuous_scale="Purples",
-        title="Top Predictive Features for Ticket Sales"
+        marker=dict(color=_top_features["importance"], coloraxis="coloraxis"),
+        hovertemplate="importance=%{x}<br>metric=%{y}<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Top Predictive Features for Ticket Sales",
+        xaxis=dict(title="importance"),
+        yaxis=dict(title="metric"),
+        coloraxis=dict(colorscale="Purples", colorbar=dict(title="importance"))
     )
+    return fig
+
+# --- SLIDE 1: Feature Importance ---
+if not top_features.empty:
+    fig_imp = build_importance_fig(version, top_features)
     slides.append({
         "title": "🔥 Key Drivers of Ticket Sales",
         "content": """
@@ -236,13 +455,16 @@ else:
     })
 
 # --- SLIDE 2: Model Performance Metrics ---
+# The metric rows only change with the CSV, so the name scans run once per data version
+@st.cache_resource(max_entries=1)
+def metric_readout(version, _model_metrics):
+    names = _model_metrics["Metric"]
+    mae_value = _model_metrics.loc[names.str.contains("MAE", case=False), "Value"].iat[0]
+    r2_value = _model_metrics.loc[names.str.contains("R", case=False), "Value"].iat[0]
+    return mae_value, r2_value
+
 if not model_metrics.empty:
-    mae_value = model_metrics.loc[
-        model_metrics["Metric"].str.contains("MAE", case=False), "Value"
-    ].values[0] if not model_metrics.empty else 0
-    r2_value = model_metrics.loc[
-        model_metrics["Metric"].str.contains("R", case=False), "Value"
-    ].values[0] if not model_metrics.empty else 0
+    mae_value, r2_value = metric_readout(version, model_metrics)
 
     slides.append({
         "title": "📉 Model Performance Metrics",
@@ -283,34 +505,39 @@ slides.append({
     "figure": None
 })
 
-# --- SLIDE NAVIGATION STATE ---
-if "insight_slide_index" not in st.session_state:
-    st.session_state.insight_slide_index = 0
-
-# --- NAVIGATION CONTROLS ---
-cols = st.columns([1, 3, 1])
-with cols[0]:
-    if st.button("⬅️ Previous", use_container_width=True, key="prev_insight",
-                 disabled=st.session_state.insight_slide_index == 0):
-        st.session_state.insight_slide_index -= 1
-with cols[2]:
-    if st.button("Next ➡️", use_container_width=True, key="next_insight",
-                 disabled=st.session_state.insight_slide_index == len(slides) - 1):
-        st.session_state.insight_slide_index += 1
-
-# --- DISPLAY CURRENT SLIDE ---
-index = max(0, min(st.session_state.insight_slide_index, len(slides) - 1))
-slide = slides[index]
-st.markdown(f"### {slide['title']}")
-st.markdown(slide["content"])
-
-if slide["figure"] is not None:
-    st.plotly_chart(slide["figure"], use_container_width=True)
-
-# Progress bar
-progress_val = (st.session_state.insight_slide_index + 1) / len(slides)
-progress_val = max(0.0, min(progress_val, 1.0))  # clamp within [0, 1]
-st.progress(progress_val)
+# Slide navigation only reruns this fragment, not the scenario pipeline and charts above
+@st.fragment
+def insight_deck(slides):
+    # --- SLIDE NAVIGATION STATE ---
+    if "insight_slide_index" not in st.session_state:
+        st.session_state.insight_slide_index = 0
+
+    # --- NAVIGATION CONTROLS ---
+    cols = st.columns([1, 3, 1])
+    with cols[0]:
+        if st.button("⬅️ Previous", use_container_width=True, key="prev_insight",
+                     disabled=st.session_state.insight_slide_index == 0):
+            st.session_state.insight_slide_index -= 1
+    with cols[2]:
+        if st.button("Next ➡️", use_container_width=True, key="next_insight",
+                     disabled=st.session_state.insight_slide_index == len(slides) - 1):
+            st.session_state.insight_slide_index += 1
+
+    # --- DISPLAY CURRENT SLIDE ---
+    index = max(0, min(st.session_state.insight_slide_index, len(slides) - 1))
+    slide = slides[index]
+    st.markdown(f"### {slide['title']}")
+    st.markdown(slide["content"])
+
+    if slide["figure"] is not None:
+        st.plotly_chart(slide["figure"], use_container_width=True, config=SUMMARY_PLOTLY_CONFIG)
+
+    # Progress bar
+    progress_val = (st.session_state.insight_slide_index + 1) / len(slides)
+    progress_val = max(0.0, min(progress_val, 1.0))  # clamp within [0, 1]
+    st.progress(progress_val)
+
+insight_deck(slides)
 
 
 # --- INTERACTIVE INSIGHTS & STRATEGIC RECOMMENDATIONS ---
@@ -324,101 +551,88 @@ st.markdown("""
 - Use this dashboard weekly to test new strategies and visualize how changes impact performance.
 """)
 
-st.info("🎯 The scenario indicator updates automatically with your inputs — Red = Danger Zone, Yellow = On Pace, Green = Strong Performance.")
+st.info("🎯 The scenario indicator updates when you click Apply Scenario — Red = Danger Zone, Yellow = On Pace, Green = Strong Performance.")
 
 st.divider()
 st.subheader("🎟️ Strategic Recommendations from Analysis")
 
-# --- SLIDE NAVIGATION SETUP ---
-recommendations = [
-    {
-        "title": "📊 Historical Context",
-        "content": """
+# --- RECOMMENDATION TABS ---
+# (title, content) pairs; fixed copy, so a constant rather than a list rebuilt for each render
+RECOMMENDATIONS = (
+    (
+        "📊 Historical Context",
+        """
         - Average **Tier C** game: **2,163 tickets**  
         - Average **Sunday** game: **2,234 tickets**  
         - Games with **promotions** average: **2,311 tickets**  
         - Historically, only **39.8%** of games reach the **2,500-ticket goal**
         """
-    },
-    {
-        "title": "1️⃣ Aggressive Promotional Package Required",
-        "content": """
+    ),
+    (
+        "1️⃣ Aggressive Promotional Package Required",
+        """
         Even with a full promotion package (**giveaway + theme + special jersey**), the model projects around **2,091 tickets**, still **409 short of goal**.  
         Standard promotions alone will not close the gap — the team should deploy:
         - A **popular bobblehead giveaway**
         - A **'Family Fun Sunday'** theme with pregame activities  
         - A **special jersey charity auction** to boost final-week interest
         """
-    },
-    {
-        "title": "2️⃣ Dynamic Pricing & Bundle Strategy",
-        "content": """
+    ),
+    (
+        "2️⃣ Dynamic Pricing & Bundle Strategy",
+        """
         Adopt a multi-tiered pricing plan to drive early momentum and fill gaps in slower periods:
         - **Early Bird (45+ days):** 15% discount to accelerate early sales  
         - **Family 4-Pack:** 4 tickets + $40 concessions credit  
         - **Group Sales (10+):** 20% discount for youth leagues  
         - **Flash Sales (7 days out):** 24-hour limited-time offer to stimulate urgency
         """
-    },
-    {
-        "title": "3️⃣ Multi-Channel Marketing Blitz",
-        "content": """
+    ),
+    (
+        "3️⃣ Multi-Channel Marketing Blitz",
+        """
         Create a staged campaign timeline to maximize awareness and urgency:
         - **60 days out:** Launch email campaign to 50k+ subscribers  
         - **30 days out:** Social media contest (win courtside seats)  
         - **14 days out:** Partner with local radio for giveaways  
         - **7 days out:** Trigger final **flash sale activation**
         """
-    },
-    {
-        "title": "4️⃣ Strategic Partnership Activation",
-        "content": """
+    ),
+    (
+        "4️⃣ Strategic Partnership Activation",
+        """
         Leverage weekend and Sunday games for high-value group sales:
         - Target **youth basketball leagues** with group offers  
         - Launch **corporate hospitality packages**  
         - Partner with **local schools and alumni associations**  
         - Collaborate with **community and church organizations** for group discounts
         """
-    },
-    {
-        "title": "5️⃣ Real-Time Pacing Monitoring",
-        "content": """
+    ),
+    (
+        "5️⃣ Real-Time Pacing Monitoring",
+        """
         Implement daily monitoring and automated triggers based on pacing performance:
         - **30+ days:** Boost digital ads & email outreach  
         - **14–30 days:** Ramp up social media and influencer promotions  
         - **7–14 days:** Deploy group discounts and targeted flash sales  
         - **Under 7 days:** Initiate last-minute pricing adjustments and urgency campaigns
         """
-    },
-    {
-        "title": "🏁 Action Plan Summary",
-        "content": """
+    ),
+    (
+        "🏁 Action Plan Summary",
+        """
         - Combine aggressive promotions with dynamic pricing and partnerships to surpass **2,500 tickets**.  
         - Focus efforts **45–60 days before the game** to capture early buyers.  
         - Use pacing data and this dashboard to adjust weekly.  
         - **Success = Consistent tracking, smart bundling, and timely campaigns.**
         """
-    }
-]
-
-# Keep track of which "slide" user is on
-if "slide_index" not in st.session_state:
-    st.session_state.slide_index = 0
-
-cols = st.columns([1, 3, 1])
-with cols[0]:
-    if st.button("⬅️ Previous", use_container_width=True, disabled=st.session_state.slide_index == 0):
-        st.session_state.slide_index -= 1
-with cols[2]:
-    if st.button("Next ➡️", use_container_width=True, disabled=st.session_state.slide_index == len(recommendations) - 1):
-        st.session_state.slide_index += 1
-
-# Display the current slide content
-# Prevent out-of-range index
-index = max(0, min(st.session_state.slide_index, len(recommendations) - 1))
-current = recommendations[index]
-
-st.markdown(f"### {current['title']}")
-st.markdown(current["content"])
+    )
+)
+
+# Every recommendation ships with the page; switching tabs happens in the browser without a rerun
+tabs = st.tabs([title for title, _ in RECOMMENDATIONS])
+for tab, (title, content) in zip(tabs, RECOMMENDATIONS):
+    tab.markdown(f"### {title}")
+    tab.markdown(content)
 
 